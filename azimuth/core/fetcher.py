@@ -1,4 +1,7 @@
+import asyncio
+import time
 from abc import abstractmethod
+from collections import deque
 from collections.abc import AsyncIterator, Iterator
 from typing import TypeVar, Generic
 
@@ -11,7 +14,11 @@ try:
     import pandas as pd
 
     def _to_dataframe(iter_: Iterator[Data]) -> pd.DataFrame:
-        return pd.DataFrame.from_dict([item.model_dump() for item in iter_])
+        columns = {}  # type: dict[str, list]
+        for item in iter_:
+            for name, value in item:
+                columns.setdefault(name, []).append(value)
+        return pd.DataFrame(columns)
 
 except ImportError:
     def _to_dataframe(*args, **kwargs):
@@ -21,38 +28,103 @@ Q = TypeVar("Q", bound=QueryParams)
 D = TypeVar("D", bound=Data)
 
 
+def _retry_after(resp: Response) -> float | None:
+    """ Returns delay in seconds before retry if the request was rate limited. """
+    if resp.status_code == 429:
+        try:
+            return float(resp.headers.get('Retry-After', 1))
+        except ValueError:
+            return 1.
+    return None
+
+
 class Fetcher(Generic[Q, D], Iterator[D], AsyncIterator[D]):
     """ Data fetcher base class
     """
+    MAX_RETRIES = 5
+    MAX_RETRY_DELAY = 60.
 
     def __init__(self, query: Q, url: URL | str) -> None:
         self.query = query
         self._url = URL(url) if isinstance(url, str) else url
-        self._data = []  # type: list[D]
+        self._data = deque()  # type: deque[D]
+        self._client = None  # type: httpx.Client | None
+        self._aclient = None  # type: httpx.AsyncClient | None
+        self._delay = 0.
+        self._retries = 0
 
     def __next__(self) -> D:
-        if not self._data and self._url:
-            with httpx.Client() as client:
-                resp = client.get(self._url)
-                if resp.status_code == 200:
-                    self._data, self._url = self.parse_response(resp)
-                else:
-                    resp.raise_for_status()
+        try:
+            while not self._data and self._url:
+                if self._delay:
+                    time.sleep(self._delay)
+                self._client = self._client or httpx.Client()
+                self._delay = self._handle_response(self._client.get(self._url))
+        except BaseException:
+            self.close()
+            raise
         if not self._data:
+            self.close()
             raise StopIteration
-        return self._data.pop(0)
+        return self._data.popleft()
 
     async def __anext__(self) -> D:
-        if not self._data and self._url:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(self._url)
-                if resp.status_code == 200:
-                    self._data, self._url = self.parse_response(resp)
-                else:
-                    resp.raise_for_status()
+        try:
+            while not self._data and self._url:
+                if self._delay:
+                    await asyncio.sleep(self._delay)
+                self._aclient = self._aclient or httpx.AsyncClient()
+                self._delay = self._handle_response(await self._aclient.get(self._url))
+        except BaseException:
+            await self.aclose()
+            raise
         if not self._data:
+            await self.aclose()
             raise StopAsyncIteration
-        return self._data.pop(0)
+        return self._data.popleft()
+
+    def _handle_response(self, resp: Response) -> float:
+        """ Handles response, returns delay in seconds before the next request. """
+        if resp.status_code == 200:
+            self._retries = 0
+            data, self._url = self.parse_response(resp)
+            self._data.extend(data)
+            return self.throttle(resp)
+        delay = _retry_after(resp)
+        if delay is None or delay > self.MAX_RETRY_DELAY or self._retries >= self.MAX_RETRIES:
+            resp.raise_for_status()
+            raise httpx.HTTPStatusError(f"Unexpected status code {resp.status_code} for url '{resp.url}'",
+                                        request=resp.request, response=resp)
+        self._retries += 1
+        return delay
+
+    def throttle(self, resp: Response) -> float:
+        """ Returns delay in seconds before the next request to stay within rate limits. """
+        return 0.
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """ Closes connection used by sync iteration. """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """ Closes connection used by async iteration. """
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
 
     @abstractmethod
     def parse_response(self, resp: Response) -> tuple[list[D], URL | None]:
@@ -70,6 +142,8 @@ class Fetcher(Generic[Q, D], Iterator[D], AsyncIterator[D]):
                     cnt += 1
             except StopIteration:
                 pass
+            finally:
+                self.close()
 
         return _to_dataframe(iter_())
 
@@ -1,9 +1,9 @@
 from abc import abstractmethod, ABC
 from datetime import datetime, date, time
-from typing import Optional
+from typing import Optional, Literal
 
 import pydantic
-from pydantic import Field, PositiveFloat, field_validator, NonNegativeFloat
+from pydantic import Field, PositiveFloat, field_validator, NonNegativeFloat, PositiveInt, NonNegativeInt
 
 from azimuth.core.utils import DateType, Interval, normalize_date
 
@@ -54,3 +54,59 @@ class CandleData(Data):
     @classmethod
     def date_validate(cls, value):
         return normalize_date(value).astimezone()
+
+
+class TradeQueryParams(QueryParams, ABC):
+    """ Base trade query params model
+    """
+    symbol: str = Field(description="Symbol.")
+    start_date: Optional[DateType] = Field(default=datetime.combine(date.today(), time.min),
+                                           description="Start of data range.")
+    end_date: Optional[DateType] = Field(default=datetime.combine(date.today(), time.max),
+                                         description="End of data range.")
+    from_id: Optional[NonNegativeInt] = Field(default=None, description="Trade id to fetch from.")
+
+    @field_validator("start_date", "end_date", mode="before")
+    @classmethod
+    def date_validate(cls, value):
+        return normalize_date(value)
+
+
+class TradeData(Data):
+    """ Base trade data model
+    """
+
+    id: Optional[int] = Field(default=None, description="Trade id")
+    date: DateType = Field(description="Trade time")
+    price: PositiveFloat = Field(description="Price")
+    volume: NonNegativeFloat = Field(description="Volume")
+    value: NonNegativeFloat = Field(description="Quote asset volume")
+    is_buyer_maker: bool = Field(description="Buyer is maker")
+
+    @field_validator("date", mode="before")
+    @classmethod
+    def date_validate(cls, value):
+        return normalize_date(value).astimezone()
+
+
+class DepthQueryParams(QueryParams, ABC):
+    """ Base order book depth query params model
+    """
+    symbol: str = Field(description="Symbol.")
+    limit: PositiveInt = Field(default=100, description="Number of price levels per side.")
+
+
+class DepthData(Data):
+    """ Base order book depth data model
+    """
+
+    date: DateType = Field(description="Snapshot time")
+    update_id: Optional[int] = Field(default=None, description="Last update id")
+    side: Literal['bid', 'ask'] = Field(description="Book side")
+    price: PositiveFloat = Field(description="Price level")
+    volume: NonNegativeFloat = Field(description="Volume")
+
+    @field_validator("date", mode="before")
+    @classmethod
+    def date_validate(cls, value):
+        return normalize_date(value).astimezone()
@@ -1,11 +1,19 @@
 from abc import ABC
+from typing import Optional
 
-from pydantic import field_validator
+from pydantic import field_validator, Field
 
-from azimuth.core.models import CandleData, CandleQueryParams
+from azimuth.core.models import CandleData, CandleQueryParams, TradeData, TradeQueryParams, DepthData, \
+    DepthQueryParams
 from azimuth.core.providers import get_provider
 
 
+def _validate_symbol(value: str) -> str:
+    if "/" in value:
+        return value.upper()
+    raise ValueError("Invalid symbol, base and quote assets must be separated by '/'.")
+
+
 class CryptoCandleQueryParams(CandleQueryParams, ABC):
     """ Base crypto candle query params model
     """
@@ -13,9 +21,7 @@ class CryptoCandleQueryParams(CandleQueryParams, ABC):
     @field_validator("symbol", mode="before")
     @classmethod
     def validate_symbol(cls, value: str):
-        if "/" in value:
-            return value.upper()
-        raise ValueError("Invalid symbol, base and quote assets must be separated by '/'.")
+        return _validate_symbol(value)
 
 
 class CryptoCandleData(CandleData):
@@ -23,11 +29,67 @@ class CryptoCandleData(CandleData):
     """
 
 
+class CryptoTradeQueryParams(TradeQueryParams, ABC):
+    """ Base crypto trade query params model
+    """
+
+    @field_validator("symbol", mode="before")
+    @classmethod
+    def validate_symbol(cls, value: str):
+        return _validate_symbol(value)
+
+
+class CryptoTradeData(TradeData):
+    """ Base crypto trade data model
+    """
+
+
+class CryptoAggTradeData(CryptoTradeData):
+    """ Base crypto aggregated trade data model
+    """
+
+    first_id: Optional[int] = Field(default=None, description="First trade id")
+    last_id: Optional[int] = Field(default=None, description="Last trade id")
+
+
+class CryptoDepthQueryParams(DepthQueryParams, ABC):
+    """ Base crypto order book depth query params model
+    """
+
+    @field_validator("symbol", mode="before")
+    @classmethod
+    def validate_symbol(cls, value: str):
+        return _validate_symbol(value)
+
+
+class CryptoDepthData(DepthData):
+    """ Base crypto order book depth data model
+    """
+
+
 def candles(symbol: str, /, provider: str = None, **query_params):
     """ Candles data source """
     assert provider, "Default provider in not implemented"  # ToDo: Sets default provider
     return get_provider(provider).fetch(CryptoCandleData, symbol=symbol, **query_params)
 
 
+def trades(symbol: str, /, provider: str = None, **query_params):
+    """ Trades data source """
+    assert provider, "Default provider in not implemented"  # ToDo: Sets default provider
+    return get_provider(provider).fetch(CryptoTradeData, symbol=symbol, **query_params)
+
+
+def agg_trades(symbol: str, /, provider: str = None, **query_params):
+    """ Aggregated trades data source """
+    assert provider, "Default provider in not implemented"  # ToDo: Sets default provider
+    return get_provider(provider).fetch(CryptoAggTradeData, symbol=symbol, **query_params)
+
+
+def depth(symbol: str, /, provider: str = None, **query_params):
+    """ Order book depth snapshot data source """
+    assert provider, "Default provider in not implemented"  # ToDo: Sets default provider
+    return get_provider(provider).fetch(CryptoDepthData, symbol=symbol, **query_params)
+
+
 def __getattr__(name):
     raise AttributeError(f"extension 'az.{__name__.split('.')[-1]}' has no attribute '{name}'")
@@ -1,4 +1,6 @@
+import time
 import typing as t
+from datetime import datetime
 from warnings import warn
 
 from httpx import Response, URL
@@ -6,7 +8,18 @@ from pydantic import field_validator
 
 import azimuth.core
 from azimuth.core.utils import start_to_timestamp, end_to_timestamp
-from azimuth.extensions.crypto import CryptoCandleData, CryptoCandleQueryParams
+from azimuth.extensions.crypto import CryptoCandleData, CryptoCandleQueryParams, CryptoTradeData, \
+    CryptoAggTradeData, CryptoTradeQueryParams, CryptoDepthData, CryptoDepthQueryParams
+
+WEIGHT_LIMIT = 6000  # Request weight per minute for IP
+
+
+def _throttle(resp: Response) -> float:
+    """ Returns delay until the next minute if the request weight is close to the limit. """
+    used_weight = int(resp.headers.get('X-MBX-USED-WEIGHT-1m', 0))
+    if used_weight >= WEIGHT_LIMIT * 0.9:
+        return 60 - time.time() % 60
+    return 0.
 
 
 class BinanceCandleData(CryptoCandleData):
@@ -39,6 +52,7 @@ class BinanceCandleFetcher(azimuth.core.Fetcher[BinanceCandleQueryParams, list[B
     """ Binance candle data fetcher.
     """
     BASE_URL = 'https://www.binance.com/api/v3/klines'
+    throttle = staticmethod(_throttle)
 
     def __init__(self, query: BinanceCandleQueryParams, /, market):
         assert market == 'spot', "Only spot market is supported"
@@ -64,6 +78,140 @@ class BinanceCandleFetcher(azimuth.core.Fetcher[BinanceCandleQueryParams, list[B
         return result, next_url
 
 
+class BinanceTradeData(CryptoTradeData):
+    """ Binance trade data.
+    """
+
+
+class BinanceAggTradeData(CryptoAggTradeData):
+    """ Binance aggregated trade data.
+    """
+
+
+class BinanceTradeQueryParams(CryptoTradeQueryParams):
+    """ Binance trade query params.
+    """
+
+    def make_url(self, base_url, from_id: int = None) -> str:
+        """ Makes internal url with query parameters. """
+        from_id = self.from_id if from_id is None else from_id
+        if from_id is None:
+            return (f"{base_url}?symbol={self.symbol.replace('/', '')}&limit=1000&"
+                    f"startTime={start_to_timestamp(self.start_date)}")
+        return f"{base_url}?symbol={self.symbol.replace('/', '')}&limit=1000&fromId={from_id}"
+
+
+class BinanceTradeFetcher(azimuth.core.Fetcher[BinanceTradeQueryParams, list[BinanceTradeData]]):
+    """ Binance trade data fetcher.
+    """
+    BASE_URL = 'https://www.binance.com/api/v3/historicalTrades'
+    LOOKUP_URL = 'https://www.binance.com/api/v3/aggTrades'
+    throttle = staticmethod(_throttle)
+
+    def __init__(self, query: BinanceTradeQueryParams, /, market):
+        assert market == 'spot', "Only spot market is supported"
+        # Trades cannot be requested by time, so the first trade id is looked up in the aggregated trades.
+        self.lookup = query.from_id is None
+        super().__init__(query, query.make_url(self.LOOKUP_URL if self.lookup else self.BASE_URL))
+        self.count = 0
+
+    def parse_response(self, resp: Response) -> tuple[list[BinanceTradeData], URL | None]:
+        result = []
+        next_url = None
+        symbol = self.query.symbol
+        data = resp.json()
+        if data and self.lookup:
+            self.lookup = False
+            next_url = self.query.make_url(self.BASE_URL, data[0]['f'])
+        elif data:
+            end_time = end_to_timestamp(self.query.end_date)
+            items = [item for item in data if item['time'] <= end_time]
+            self.count += len(items)
+            if len(items) == len(data) == 1000:
+                next_url = self.query.make_url(self.BASE_URL, data[-1]['id'] + 1)
+            result.extend([BinanceTradeData(id=item['id'], date=item['time'], price=item['price'],
+                                            volume=item['qty'], value=item['quoteQty'],
+                                            is_buyer_maker=item['isBuyerMaker'])
+                           for item in items])
+        else:
+            if self.count == 0:
+                warn(f"Symbol Error: No data found for {symbol}")
+        return result, next_url
+
+
+class BinanceAggTradeFetcher(azimuth.core.Fetcher[BinanceTradeQueryParams, list[BinanceAggTradeData]]):
+    """ Binance aggregated trade data fetcher.
+    """
+    BASE_URL = 'https://www.binance.com/api/v3/aggTrades'
+    throttle = staticmethod(_throttle)
+
+    def __init__(self, query: BinanceTradeQueryParams, /, market):
+        assert market == 'spot', "Only spot market is supported"
+        super().__init__(query, query.make_url(self.BASE_URL))
+        self.count = 0
+
+    def parse_response(self, resp: Response) -> tuple[list[BinanceAggTradeData], URL | None]:
+        result = []
+        next_url = None
+        symbol = self.query.symbol
+        data = resp.json()
+        if data:
+            end_time = end_to_timestamp(self.query.end_date)
+            items = [item for item in data if item['T'] <= end_time]
+            self.count += len(items)
+            if len(items) == len(data) == 1000:
+                next_url = self.query.make_url(self.BASE_URL, data[-1]['a'] + 1)
+            result.extend([BinanceAggTradeData(id=item['a'], first_id=item['f'], last_id=item['l'], date=item['T'],
+                                               price=item['p'], volume=item['q'],
+                                               value=float(item['p']) * float(item['q']),
+                                               is_buyer_maker=item['m'])
+                           for item in items])
+        else:
+            if self.count == 0:
+                warn(f"Symbol Error: No data found for {symbol}")
+        return result, next_url
+
+
+class BinanceDepthData(CryptoDepthData):
+    """ Binance order book depth data.
+    """
+
+
+class BinanceDepthQueryParams(CryptoDepthQueryParams):
+    """ Binance order book depth query params.
+    """
+
+    @field_validator("limit")
+    @classmethod
+    def limit_validate(cls, value):
+        if value <= 5000:
+            return value
+        raise ValueError("Limit must be less than or equal to 5000")
+
+    def make_url(self, base_url) -> str:
+        """ Makes internal url with query parameters. """
+        return f"{base_url}?symbol={self.symbol.replace('/', '')}&limit={self.limit}"
+
+
+class BinanceDepthFetcher(azimuth.core.Fetcher[BinanceDepthQueryParams, list[BinanceDepthData]]):
+    """ Binance order book depth snapshot fetcher.
+    """
+    BASE_URL = 'https://www.binance.com/api/v3/depth'
+    throttle = staticmethod(_throttle)
+
+    def __init__(self, query: BinanceDepthQueryParams, /, market):
+        assert market == 'spot', "Only spot market is supported"
+        super().__init__(query, query.make_url(self.BASE_URL))
+
+    def parse_response(self, resp: Response) -> tuple[list[BinanceDepthData], URL | None]:
+        data = resp.json()
+        now = datetime.now()
+        update_id = data['lastUpdateId']
+        return [BinanceDepthData(date=now, update_id=update_id, side=side, price=price, volume=volume)
+                for side, key in (('bid', 'bids'), ('ask', 'asks'))
+                for price, volume in data[key]], None
+
+
 class Provider(azimuth.core.Provider):
     """ Binance data provider.
     """
@@ -71,9 +219,12 @@ class Provider(azimuth.core.Provider):
     def __init__(self, market: str = 'spot'):
         self.kwargs = dict(market=market)
 
-    def fetch(self, data_type: t.Type[CryptoCandleData], **kwargs):
+    def fetch(self, data_type: t.Type[CryptoCandleData | CryptoTradeData | CryptoDepthData], **kwargs):
         map = {
-            CryptoCandleData: lambda: BinanceCandleFetcher(BinanceCandleQueryParams(**kwargs), **self.kwargs)
+            CryptoCandleData: lambda: BinanceCandleFetcher(BinanceCandleQueryParams(**kwargs), **self.kwargs),
+            CryptoTradeData: lambda: BinanceTradeFetcher(BinanceTradeQueryParams(**kwargs), **self.kwargs),
+            CryptoAggTradeData: lambda: BinanceAggTradeFetcher(BinanceTradeQueryParams(**kwargs), **self.kwargs),
+            CryptoDepthData: lambda: BinanceDepthFetcher(BinanceDepthQueryParams(**kwargs), **self.kwargs)
         }
         if fetcher_factory := map.get(data_type):
             return fetcher_factory()
@@ -2,12 +2,13 @@ import typing as t
 from warnings import warn
 
 from httpx import Response, URL
-from pydantic import field_validator
+from pydantic import field_validator, Field
 
 import azimuth.core
 from azimuth.core.utils import start_to_timestamp, end_to_timestamp, interval_to_timestamp, normalize_date, \
     times_for_reverse
-from azimuth.extensions.crypto import CryptoCandleData, CryptoCandleQueryParams
+from azimuth.extensions.crypto import CryptoCandleData, CryptoCandleQueryParams, CryptoTradeData, \
+    CryptoTradeQueryParams, CryptoDepthData, CryptoDepthQueryParams
 
 _INTERVA_CNV = {'1m': '1', '3m': '3', '5m': '5', '15m': '15', '30m': '30',
                 '1h': '60', '2h': '120', '4h': '240', '6h': '360', '12h': '720', '1d': 'D', '1W': 'W', '1M': 'M'}
@@ -77,6 +78,107 @@ class BybitCandleFetcher(azimuth.core.Fetcher[BybitCandleQueryParams, list[Bybit
 
 # 'https://api.bybit.com/v5/market/kline?category=spot&symbol=BTCUSDT&interval=60&limit=3&start=1728248400000&end=1731848400000'
 
+class BybitTradeData(CryptoTradeData):
+    """ Bybit trade data.
+    """
+
+    exec_id: str = Field(description="Execution id")
+
+    @field_validator("date", mode="before")
+    @classmethod
+    def date_validate(cls, value):
+        return normalize_date(int(value))
+
+
+class BybitTradeQueryParams(CryptoTradeQueryParams):
+    """ Bybit trade query params.
+    """
+
+    @field_validator("from_id")
+    @classmethod
+    def from_id_validate(cls, value):
+        if value is None:
+            return value
+        raise ValueError("Fetching from trade id is not supported")
+
+    def make_url(self, base_url) -> str:
+        """ Makes internal url with query parameters. """
+        return f"{base_url}?category=spot&symbol={self.symbol.replace('/', '')}&limit=60"
+
+
+class BybitTradeFetcher(azimuth.core.Fetcher[BybitTradeQueryParams, list[BybitTradeData]]):
+    """ Bybit trade data fetcher, only recent trades are available.
+    """
+    BASE_URL = 'https://api.bybit.com/v5/market/recent-trade'
+
+    def __init__(self, query: BybitTradeQueryParams, /, market):
+        assert market == 'spot', "Only spot market is supported"
+        super().__init__(query, query.make_url(self.BASE_URL))
+
+    def parse_response(self, resp: Response) -> tuple[list[BybitTradeData], URL | None]:
+        result = []
+        symbol = self.query.symbol
+        data = resp.json()
+        if data and data['retCode'] == 0:
+            start_time = start_to_timestamp(self.query.start_date)
+            end_time = end_to_timestamp(self.query.end_date)
+            data = [item for item in data['result']['list'] if start_time <= int(item['time']) <= end_time]
+            result.extend([
+                BybitTradeData(id=int(item['execId']) if item['execId'].isdigit() else None,
+                               exec_id=item['execId'], date=item['time'], price=item['price'], volume=item['size'],
+                               value=float(item['price']) * float(item['size']),
+                               is_buyer_maker=item['side'] == 'Sell')
+                for item in sorted(data, key=lambda item: int(item['time']))
+            ])
+        if not result:
+            warn(f"Symbol Error: No data found for {symbol}")
+        return result, None
+
+
+class BybitDepthData(CryptoDepthData):
+    """ Bybit order book depth data.
+    """
+
+
+class BybitDepthQueryParams(CryptoDepthQueryParams):
+    """ Bybit order book depth query params.
+    """
+
+    @field_validator("limit")
+    @classmethod
+    def limit_validate(cls, value):
+        if value <= 200:
+            return value
+        raise ValueError("Limit must be less than or equal to 200")
+
+    def make_url(self, base_url) -> str:
+        """ Makes internal url with query parameters. """
+        return f"{base_url}?category=spot&symbol={self.symbol.replace('/', '')}&limit={self.limit}"
+
+
+class BybitDepthFetcher(azimuth.core.Fetcher[BybitDepthQueryParams, list[BybitDepthData]]):
+    """ Bybit order book depth snapshot fetcher.
+    """
+    BASE_URL = 'https://api.bybit.com/v5/market/orderbook'
+
+    def __init__(self, query: BybitDepthQueryParams, /, market):
+        assert market == 'spot', "Only spot market is supported"
+        super().__init__(query, query.make_url(self.BASE_URL))
+
+    def parse_response(self, resp: Response) -> tuple[list[BybitDepthData], URL | None]:
+        result = []
+        symbol = self.query.symbol
+        data = resp.json()
+        if data and data['retCode'] == 0:
+            data = data['result']
+            result.extend([BybitDepthData(date=data['ts'], update_id=data['u'], side=side, price=price, volume=volume)
+                           for side, key in (('bid', 'b'), ('ask', 'a'))
+                           for price, volume in data[key]])
+        else:
+            warn(f"Symbol Error: No data found for {symbol}")
+        return result, None
+
+
 class Provider(azimuth.core.Provider):
     """ Bybit data provider.
     """
@@ -84,9 +186,11 @@ class Provider(azimuth.core.Provider):
     def __init__(self, market: str = 'spot'):
         self.kwargs = dict(market=market)
 
-    def fetch(self, data_type: t.Type[CryptoCandleData], **kwargs):
+    def fetch(self, data_type: t.Type[CryptoCandleData | CryptoTradeData | CryptoDepthData], **kwargs):
         map = {
-            CryptoCandleData: lambda: BybitCandleFetcher(BybitCandleQueryParams(**kwargs), **self.kwargs)
+            CryptoCandleData: lambda: BybitCandleFetcher(BybitCandleQueryParams(**kwargs), **self.kwargs),
+            CryptoTradeData: lambda: BybitTradeFetcher(BybitTradeQueryParams(**kwargs), **self.kwargs),
+            CryptoDepthData: lambda: BybitDepthFetcher(BybitDepthQueryParams(**kwargs), **self.kwargs)
         }
         if fetcher_factory := map.get(data_type):
             return fetcher_factory()
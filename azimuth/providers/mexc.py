@@ -1,12 +1,14 @@
 import typing as t
+from datetime import datetime
 from warnings import warn
 
 from httpx import URL, Response
 from pydantic import field_validator
 
 import azimuth.core
-from azimuth.core.utils import start_to_timestamp, end_to_timestamp
-from azimuth.extensions.crypto import CryptoCandleData, CryptoCandleQueryParams
+from azimuth.core.utils import start_to_timestamp, end_to_timestamp, normalize_date
+from azimuth.extensions.crypto import CryptoCandleData, CryptoCandleQueryParams, CryptoTradeData, \
+    CryptoAggTradeData, CryptoTradeQueryParams, CryptoDepthData, CryptoDepthQueryParams
 
 
 class MEXCCandleData(CryptoCandleData):
@@ -65,6 +67,145 @@ class MEXCCandleFetcher(azimuth.core.Fetcher[MEXCCandleQueryParams, list[MEXCCan
         return result, next_url
 
 
+class MEXCTradeData(CryptoTradeData):
+    """ MEXC trade data.
+    """
+
+
+class MEXCAggTradeData(CryptoAggTradeData):
+    """ MEXC aggregated trade data.
+    """
+
+
+class MEXCTradeQueryParams(CryptoTradeQueryParams):
+    """ MEXC trade query params.
+    """
+
+    @field_validator("from_id")
+    @classmethod
+    def from_id_validate(cls, value):
+        if value is None:
+            return value
+        raise ValueError("Fetching from trade id is not supported")
+
+    def make_url(self, base_url, start_time: int = None) -> str:
+        """ Makes internal url with query parameters. """
+        url = f"{base_url}?symbol={self.symbol.replace('/', '')}&limit=1000"
+        return url if start_time is None else f"{url}&startTime={start_time}"
+
+
+class MEXCTradeFetcher(azimuth.core.Fetcher[MEXCTradeQueryParams, list[MEXCTradeData]]):
+    """ MEXC trade data fetcher, only recent trades are available.
+    """
+    BASE_URL = 'https://api.mexc.com/api/v3/trades'
+
+    def __init__(self, query: MEXCTradeQueryParams, /, market):
+        assert market == 'spot', "Only spot market is supported"
+        super().__init__(query, query.make_url(self.BASE_URL))
+
+    def parse_response(self, resp: Response) -> tuple[list[MEXCTradeData], URL | None]:
+        symbol = self.query.symbol
+        start_time = start_to_timestamp(self.query.start_date)
+        end_time = end_to_timestamp(self.query.end_date)
+        data = [item for item in resp.json() if start_time <= item['time'] <= end_time]
+        if not data:
+            warn(f"Symbol Error: No data found for {symbol}")
+        return [MEXCTradeData(id=item['id'], date=item['time'], price=item['price'], volume=item['qty'],
+                              value=item['quoteQty'], is_buyer_maker=item['isBuyerMaker'])
+                for item in sorted(data, key=lambda item: item['time'])], None
+
+
+class MEXCAggTradeFetcher(azimuth.core.Fetcher[MEXCTradeQueryParams, list[MEXCAggTradeData]]):
+    """ MEXC aggregated trade data fetcher.
+
+    MEXC has no trade ids, so pages are requested by time. If more than one page
+    of trades has the same millisecond, trades beyond that page are lost, a warning is issued.
+    """
+    BASE_URL = 'https://api.mexc.com/api/v3/aggTrades'
+
+    def __init__(self, query: MEXCTradeQueryParams, /, market):
+        assert market == 'spot', "Only spot market is supported"
+        super().__init__(query, query.make_url(self.BASE_URL, start_to_timestamp(query.start_date)))
+        self.count = 0
+        # The trades of the last millisecond already fetched are skipped on the next page.
+        self.last_time = None
+        self.skip = 0
+
+    def parse_response(self, resp: Response) -> tuple[list[MEXCAggTradeData], URL | None]:
+        result = []
+        next_url = None
+        symbol = self.query.symbol
+        data = resp.json()
+        if data:
+            skip = 0
+            while skip < min(self.skip, len(data)) and data[skip]['T'] == self.last_time:
+                skip += 1
+            end_time = end_to_timestamp(self.query.end_date)
+            items = [item for item in data[skip:] if item['T'] <= end_time]
+            self.count += len(items)
+            if items:
+                last_time = items[-1]['T']
+                last_count = sum(1 for item in items if item['T'] == last_time)
+                self.skip = self.skip + last_count if last_time == self.last_time else last_count
+                self.last_time = last_time
+            if len(data) == 1000 and len(items) == len(data) - skip:
+                if items:
+                    next_url = self.query.make_url(self.BASE_URL, self.last_time)
+                else:
+                    warn(f"Data Loss: Trades of {symbol} at {normalize_date(self.last_time).isoformat()} "
+                         f"exceed the page size and were skipped")
+                    next_url = self.query.make_url(self.BASE_URL, self.last_time + 1)
+                    self.skip = 0
+            result.extend([MEXCAggTradeData(id=item['a'], first_id=item['f'], last_id=item['l'], date=item['T'],
+                                            price=item['p'], volume=item['q'],
+                                            value=float(item['p']) * float(item['q']),
+                                            is_buyer_maker=item['m'])
+                           for item in items])
+        else:
+            if self.count == 0:
+                warn(f"Symbol Error: No data found for {symbol}")
+        return result, next_url
+
+
+class MEXCDepthData(CryptoDepthData):
+    """ MEXC order book depth data.
+    """
+
+
+class MEXCDepthQueryParams(CryptoDepthQueryParams):
+    """ MEXC order book depth query params.
+    """
+
+    @field_validator("limit")
+    @classmethod
+    def limit_validate(cls, value):
+        if value <= 5000:
+            return value
+        raise ValueError("Limit must be less than or equal to 5000")
+
+    def make_url(self, base_url) -> str:
+        """ Makes internal url with query parameters. """
+        return f"{base_url}?symbol={self.symbol.replace('/', '')}&limit={self.limit}"
+
+
+class MEXCDepthFetcher(azimuth.core.Fetcher[MEXCDepthQueryParams, list[MEXCDepthData]]):
+    """ MEXC order book depth snapshot fetcher.
+    """
+    BASE_URL = 'https://api.mexc.com/api/v3/depth'
+
+    def __init__(self, query: MEXCDepthQueryParams, /, market):
+        assert market == 'spot', "Only spot market is supported"
+        super().__init__(query, query.make_url(self.BASE_URL))
+
+    def parse_response(self, resp: Response) -> tuple[list[MEXCDepthData], URL | None]:
+        data = resp.json()
+        date = data.get('timestamp') or datetime.now()
+        update_id = data['lastUpdateId']
+        return [MEXCDepthData(date=date, update_id=update_id, side=side, price=price, volume=volume)
+                for side, key in (('bid', 'bids'), ('ask', 'asks'))
+                for price, volume in data[key]], None
+
+
 class Provider(azimuth.core.Provider):
     """ MEXC data provider.
     """
@@ -72,9 +213,12 @@ class Provider(azimuth.core.Provider):
     def __init__(self, market: str = 'spot'):
         self.kwargs = dict(market=market)
 
-    def fetch(self, data_type: t.Type[CryptoCandleData], **kwargs):
+    def fetch(self, data_type: t.Type[CryptoCandleData | CryptoTradeData | CryptoDepthData], **kwargs):
         map = {
-            CryptoCandleData: lambda: MEXCCandleFetcher(MEXCCandleQueryParams(**kwargs), **self.kwargs)
+            CryptoCandleData: lambda: MEXCCandleFetcher(MEXCCandleQueryParams(**kwargs), **self.kwargs),
+            CryptoTradeData: lambda: MEXCTradeFetcher(MEXCTradeQueryParams(**kwargs), **self.kwargs),
+            CryptoAggTradeData: lambda: MEXCAggTradeFetcher(MEXCTradeQueryParams(**kwargs), **self.kwargs),
+            CryptoDepthData: lambda: MEXCDepthFetcher(MEXCDepthQueryParams(**kwargs), **self.kwargs)
         }
         if fetcher_factory := map.get(data_type):
             return fetcher_factory()
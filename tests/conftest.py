@@ -0,0 +1,41 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """ Routes requests of fetchers to the handler, returns list of created clients. """
+    clients = []
+    client_cls, async_client_cls = httpx.Client, httpx.AsyncClient
+
+    def install(handler):
+        transport = httpx.MockTransport(handler)
+
+        def factory(cls):
+            def client(**kwargs):
+                clients.append(cls(transport=transport, **kwargs))
+                return clients[-1]
+
+            return client
+
+        monkeypatch.setattr(httpx, 'Client', factory(client_cls))
+        monkeypatch.setattr(httpx, 'AsyncClient', factory(async_client_cls))
+        return clients
+
+    return install
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """ Records delays instead of sleeping. """
+    delays = []
+
+    async def async_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(time, 'sleep', delays.append)
+    monkeypatch.setattr(asyncio, 'sleep', async_sleep)
+    return delays
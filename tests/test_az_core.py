@@ -1,6 +1,11 @@
 from datetime import datetime, date
+from itertools import islice
 
-from azimuth.core.models import CandleQueryParams
+import httpx
+import pytest
+
+from azimuth.core import Fetcher
+from azimuth.core.models import CandleQueryParams, CandleData, Data
 from azimuth.core.utils import normalize_date, start_to_timestamp, end_to_timestamp, to_timestamp
 
 
@@ -38,4 +43,97 @@ def test_candle_query_params():
     qdt = _CandleQueryParams(symbol='TEST', start_date="2024-10-01 00:00:00", end_date="2024-10-01 23:59:59.999")
     assert start_to_timestamp(qd.start_date) == to_timestamp(qdt.start_date)
     assert end_to_timestamp(qd.end_date) == to_timestamp(qdt.end_date)
-    assert True
\ No newline at end of file
+    assert True
+
+class _Fetcher(Fetcher):
+    BASE_URL = 'https://test/pages'
+
+    def __init__(self):
+        super().__init__(None, f"{self.BASE_URL}?page=0")
+
+    def parse_response(self, resp):
+        page = int(resp.url.params['page'])
+        data = [Data() for _ in resp.json()]
+        return data, f"{self.BASE_URL}?page={page + 1}" if page < 3 else None
+
+
+def _pages(request):
+    # The second page is empty
+    return httpx.Response(200, json=[[], [1, 2], [], [3]][int(request.url.params['page'])])
+
+
+def test_fetcher_pages(mock_http):
+    clients = mock_http(_pages)
+    fetcher = _Fetcher()
+    assert len(list(fetcher)) == 3
+    assert len(clients) == 1 and clients[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_fetcher_pages_async(mock_http):
+    clients = mock_http(_pages)
+    assert len([item async for item in _Fetcher()]) == 3
+    assert len(clients) == 1 and clients[0].is_closed
+
+
+def test_fetcher_close(mock_http):
+    clients = mock_http(_pages)
+    with _Fetcher() as fetcher:
+        assert len(list(islice(fetcher, 1))) == 1
+        assert not clients[0].is_closed
+    assert clients[0].is_closed
+
+    clients = mock_http(lambda request: httpx.Response(500))
+    with pytest.raises(httpx.HTTPStatusError):
+        next(_Fetcher())
+    assert clients[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_fetcher_close_async(mock_http):
+    clients = mock_http(_pages)
+    async with _Fetcher() as fetcher:
+        assert await anext(fetcher)
+    assert clients[0].is_closed
+
+
+def test_fetcher_retry_after(mock_http, sleeps):
+    responses = [httpx.Response(429, headers={'Retry-After': '3'}), httpx.Response(429)]
+    mock_http(lambda request: responses.pop(0) if responses else _pages(request))
+    assert len(list(_Fetcher())) == 3
+    assert sleeps == [3., 1.]
+
+    mock_http(lambda request: httpx.Response(429))
+    with pytest.raises(httpx.HTTPStatusError):
+        list(_Fetcher())
+    assert len(sleeps) == 2 + _Fetcher.MAX_RETRIES
+
+    mock_http(lambda request: httpx.Response(429, headers={'Retry-After': '3600'}))
+    with pytest.raises(httpx.HTTPStatusError):
+        list(_Fetcher())
+    assert len(sleeps) == 2 + _Fetcher.MAX_RETRIES
+
+
+def test_fetcher_throttle(mock_http, sleeps):
+    class _ThrottledFetcher(_Fetcher):
+        def throttle(self, resp):
+            return 0.5
+
+    mock_http(_pages)
+    assert len(list(_ThrottledFetcher())) == 3
+    assert sleeps == [0.5, 0.5, 0.5]
+
+
+def test_fetcher_to_dataframe(mock_http):
+    pd = pytest.importorskip("pandas")
+
+    class _CandleFetcher(_Fetcher):
+        def parse_response(self, resp):
+            return [CandleData(date=datetime(2024, 10, 1), open=1, high=2, low=1, close=2, volume=3, value=4)], None
+
+    clients = mock_http(_pages)
+    df = _CandleFetcher().to_dataframe()
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns) == ['date', 'open', 'high', 'low', 'close', 'volume', 'value']
+    assert df['value'].tolist() == [4.]
+    assert clients[0].is_closed
@@ -1,8 +1,12 @@
 from datetime import date, datetime
 
+import httpx
 import pytest
 
 from azimuth import az
+from azimuth.core.utils import start_to_timestamp
+
+T0 = start_to_timestamp("2024-10-01")
 
 
 def test_az_import_error():
@@ -54,6 +58,98 @@ async def test_az_crypto_providers_mexc():
     data = [item.model_dump() for item in it]
     assert data and len(data) == 31
 
+def test_az_crypto_fetcher_error():
+    with pytest.raises(ValueError, match="Cannot resolve fetcher for: 'CryptoAggTradeData'"):
+        assert not az.crypto.agg_trades('BTC/USDT', provider="bybit")
+    assert az.crypto.agg_trades('BTC/USDT', provider="binance")
+
+
+@pytest.mark.asyncio
+async def test_az_crypto_trades_binance():
+    start_date = "2024-10-07 00:00:00"
+    end_date = "2024-10-07 00:05:00"
+    adata = [item.model_dump() async for item in
+             az.crypto.agg_trades('BTC/USDT', provider="binance", start_date=start_date, end_date=end_date)]
+    assert adata and len(adata) > 1000
+    assert [item['id'] for item in adata] == list(range(adata[0]['id'], adata[-1]['id'] + 1))
+
+    data = [item.model_dump() for item in
+            az.crypto.trades('BTC/USDT', provider="binance", start_date=start_date, end_date=end_date)]
+    assert data[0]['id'] == adata[0]['first_id']
+    assert data[-1]['id'] == adata[-1]['last_id']
+
+
+def test_az_crypto_depth():
+    for provider in ("binance", "mexc", "bybit"):
+        data = [item.model_dump() for item in az.crypto.depth('BTC/USDT', provider=provider, limit=50)]
+        bids = [item['price'] for item in data if item['side'] == 'bid']
+        asks = [item['price'] for item in data if item['side'] == 'ask']
+        assert len(bids) == len(asks) == 50
+        assert max(bids) < min(asks)
+
+def _agg_trades(request, trades):
+    params = request.url.params
+    if 'fromId' in params:
+        start = int(params['fromId'])
+    else:
+        start = next((i for i, item in enumerate(trades) if item['T'] >= int(params['startTime'])), len(trades))
+    return httpx.Response(200, json=trades[start:start + 1000])
+
+
+def test_az_crypto_agg_trades_mexc(mock_http):
+    trades = [dict(a=None, f=None, l=None, p="10", q=str(i), T=T0 + i // 7, m=True, M=True) for i in range(5000)]
+    mock_http(lambda request: _agg_trades(request, trades))
+    data = [item.model_dump() for item in az.crypto.agg_trades('BTC/USDT', provider="mexc", start_date="2024-10-01")]
+    assert [item['volume'] for item in data] == list(range(5000))
+
+
+def test_az_crypto_agg_trades_mexc_loss(mock_http):
+    trades = [dict(a=None, f=None, l=None, p="10", q=str(i), T=T0 + (i > 100) + (i > 1300), m=True, M=True)
+              for i in range(1500)]
+    mock_http(lambda request: _agg_trades(request, trades))
+    with pytest.warns(UserWarning, match="Data Loss"):
+        data = [item.model_dump() for item in
+                az.crypto.agg_trades('BTC/USDT', provider="mexc", start_date="2024-10-01")]
+    assert [item['volume'] for item in data] == list(range(1101)) + list(range(1301, 1500))
+
+
+def test_az_crypto_trades_binance_offline(mock_http, sleeps):
+    agg_trades = [dict(a=i, f=i * 2, l=i * 2 + 1, p="10", q="1", T=T0 + i, m=True, M=True) for i in range(10)]
+    trades = [dict(id=i, price="10", qty="1", quoteQty="10", time=T0 + i // 2, isBuyerMaker=False, isBestMatch=True)
+              for i in range(2500)]
+
+    def handler(request):
+        if request.url.path.endswith('aggTrades'):
+            return _agg_trades(request, agg_trades)
+        start = int(request.url.params['fromId'])
+        return httpx.Response(200, json=trades[start:start + 1000], headers={'X-MBX-USED-WEIGHT-1m': '5900'})
+
+    mock_http(handler)
+    data = [item.model_dump() for item in az.crypto.trades('BTC/USDT', provider="binance", start_date="2024-10-01")]
+    assert [item['id'] for item in data] == list(range(2500))
+    assert len(sleeps) == 2 and all(0 < delay <= 60 for delay in sleeps)
+
+    with pytest.warns(UserWarning, match="No data found"):
+        assert not list(az.crypto.trades('BTC/USDT', provider="binance", start_date="2024-10-02"))
+
+
+def test_az_crypto_trades_bybit_offline(mock_http):
+    trades = [dict(execId="2100000000007764263", symbol="BTCUSDT", price="10", size="2", side="Sell",
+                   time=str(T0 + 1), isBlockTrade=False)]
+    mock_http(lambda request: httpx.Response(200, json=dict(retCode=0, result=dict(list=trades))))
+    data = [item.model_dump() for item in az.crypto.trades('BTC/USDT', provider="bybit", start_date="2024-10-01")]
+    assert data[0]['id'] == 2100000000007764263
+    assert data[0]['exec_id'] == "2100000000007764263"
+    assert data[0]['is_buyer_maker'] and data[0]['value'] == 20
+
+
+def test_az_crypto_trades_from_id_error():
+    for provider in ("mexc", "bybit"):
+        with pytest.raises(ValueError, match="Fetching from trade id is not supported"):
+            assert not az.crypto.trades('BTC/USDT', provider=provider, from_id=1)
+    assert az.crypto.trades('BTC/USDT', provider="binance", from_id=1)
+
+
 # @pytest.mark.asyncio
 # async def test_az_crypto_candles_bybit():
 #     iter_ = az.crypto.candles('BTC/USDT', provider="bybit", interval="1d",